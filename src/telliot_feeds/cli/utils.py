@@ -1,5 +1,6 @@
 import functools
 import os
+from dataclasses import fields
 from typing import Any
 from typing import Callable
 from typing import cast
@@ -197,7 +198,8 @@ def build_feed_from_input() -> Optional[DataFeed[Any]]:
     except KeyError:
         click.echo(f"No corresponding datafeed found for QueryType: {query_type}\n")
         return None
-    for query_param in feed.query.__dict__.keys():
+    # iterate the fields rather than __dict__, which drops cached query data/id when a param is set
+    for query_param in [f.name for f in fields(feed.query)]:
         # accessing the datatype
         type_hints = get_type_hints(feed.query)
         # get param type if type isn't optional
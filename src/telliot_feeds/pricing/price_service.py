@@ -2,11 +2,26 @@ from abc import ABC
 from abc import abstractmethod
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 import requests
 
 from telliot_feeds.dtypes.datapoint import OptionalDataPoint
 
+_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the HTTP session shared by web price services
+
+    Reusing one session keeps connections to each API alive between
+    fetches instead of doing a new TCP/TLS handshake every report.
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
 
 class PriceServiceInterface(ABC):
     """Price Service Interface
@@ -58,17 +73,16 @@ class WebPriceService(PriceServiceInterface):
 
         request_url = self.url + url
 
-        with requests.Session() as s:
-            try:
-                r = s.get(request_url, timeout=self.timeout)
-                json_data = r.json()
-                return {"response": json_data}
+        try:
+            r = get_session().get(request_url, timeout=self.timeout)
+            json_data = r.json()
+            return {"response": json_data}
 
-            except requests.exceptions.ConnectTimeout as e:
-                return {"error": "Timeout Error", "exception": e}
+        except requests.exceptions.ConnectTimeout as e:
+            return {"error": "Timeout Error", "exception": e}
 
-            except requests.exceptions.JSONDecodeError as e:
-                return {"error": "JSON Decode Error", "exception": e}
+        except requests.exceptions.JSONDecodeError as e:
+            return {"error": "JSON Decode Error", "exception": e}
 
-            except Exception as e:
-                return {"error": str(type(e)), "exception": e}
+        except Exception as e:
+            return {"error": str(type(e)), "exception": e}
@@ -62,7 +62,12 @@ class AbiQuery(OracleQuery):
         """Encode the query type and parameters to create the query data.
 
         This method uses ABI encoding to encode the query's parameter values.
+        The result is cached until a query parameter changes.
         """
+        query_data: Optional[bytes] = self.__dict__.get("_query_data")
+        if query_data is not None:
+            return query_data
+
         # If the query has parameters
         if self.abi:
             param_values = [getattr(self, p["name"]) for p in self.abi]
@@ -79,7 +84,8 @@ class AbiQuery(OracleQuery):
             right_side = b"\0".rjust(32, b"\0")
             encoded_params = left_side + right_side
 
-        return encode_abi(["string", "bytes"], [type(self).__name__, encoded_params])
+        self._query_data = encode_abi(["string", "bytes"], [type(self).__name__, encoded_params])
+        return self._query_data
 
     @staticmethod
     def get_query_from_data(query_data: bytes) -> Optional[OracleQuery]:
@@ -70,13 +70,26 @@ class OracleQuery(Serializable):
         json_str = json.dumps(state, separators=(",", ":"))
         return json_str
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # A changed query parameter invalidates the cached query data and id
+        if not name.startswith("_"):
+            self.__dict__.pop("_query_data", None)
+            self.__dict__.pop("_query_id", None)
+        super().__setattr__(name, value)
+
     @property
     def query_id(self) -> bytes:
         """Returns the query ``id`` for use with the
         ``TellorX.Oracle.tipQuery()`` and ``TellorX.Oracle.submitValue()``
         contract calls.
+
+        The id is computed once and cached until a query parameter changes.
         """
-        return bytes(Web3.keccak(self.query_data))
+        query_id: Optional[bytes] = self.__dict__.get("_query_id")
+        if query_id is None:
+            query_id = bytes(Web3.keccak(self.query_data))
+            self._query_id = query_id
+        return query_id
 
     @property
     def query_data(self) -> bytes:
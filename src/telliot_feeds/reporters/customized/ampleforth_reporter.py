@@ -19,6 +19,8 @@ T = TypeVar("T")
 
 @dataclass
 class GetDataBefore:
+    __slots__ = ("retrieved", "value", "timestampRetrieved")
+
     retrieved: bool
     value: bytes
     timestampRetrieved: int
@@ -23,6 +23,8 @@ class RoundData:
 
 @dataclass
 class GetDataBefore:
+    __slots__ = ("retrieved", "value", "timestampRetrieved")
+
     retrieved: bool
     value: bytes
     timestampRetrieved: int
@@ -1,7 +1,10 @@
 import asyncio
+import time
 from dataclasses import dataclass
 from typing import Any
+from typing import Dict
 from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 
 from web3 import Web3
@@ -14,9 +17,14 @@ from telliot_feeds.utils.reporter_utils import current_time
 logger = get_logger(__name__)
 T = TypeVar("T")
 
+# Seconds to reuse getDataBefore responses between condition checks
+TELLOR_CACHE_TTL = 20
+
 
 @dataclass
 class GetDataBefore:
+    __slots__ = ("retrieved", "value", "timestampRetrieved")
+
     retrieved: bool
     value: bytes
     timestampRetrieved: int
@@ -32,6 +40,7 @@ class ConditionalReporter(Tellor360Reporter):
         stale_timeout: int,
         max_price_change: float,
         datafeed: Optional[DataFeed[Any]] = None,
+        tellor_cache_ttl: float = TELLOR_CACHE_TTL,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -40,21 +49,36 @@ class ConditionalReporter(Tellor360Reporter):
         self.max_price_change = max_price_change
         self.datafeed = datafeed
         self.qtag_selected = True
+        # kept short so reports from other reporters are seen within a few loops
+        self.tellor_cache_ttl = tellor_cache_ttl
+        self._tellor_cache: Dict[bytes, Tuple[GetDataBefore, float]] = {}
+
+    def flush_tellor_cache(self) -> None:
+        """Drop cached oracle data so the next check reads fresh values"""
+        self._tellor_cache.clear()
 
     async def get_tellor_latest_data(self) -> Optional[GetDataBefore]:
         """Get latest data from tellor oracle (getDataBefore with current time)
 
+        Responses are reused for tellor_cache_ttl seconds
+
         Returns:
         - Optional[GetDataBefore]: latest data from tellor oracle
         """
         if self.datafeed is None:
             logger.debug(f"no datafeed set: {self.datafeed}")
             return None
-        data, status = await self.oracle.read("getDataBefore", self.datafeed.query.query_id, current_time())
+        query_id = self.datafeed.query.query_id
+        cached = self._tellor_cache.get(query_id)
+        if cached is not None and time.monotonic() - cached[1] < self.tellor_cache_ttl:
+            return cached[0]
+        data, status = await self.oracle.read("getDataBefore", query_id, current_time())
         if not status.ok:
             logger.warning(f"error getting tellor data: {status.e}")
             return None
-        return GetDataBefore(*data)
+        tellor_data = GetDataBefore(*data)
+        self._tellor_cache[query_id] = (tellor_data, time.monotonic())
+        return tellor_data
 
     async def get_telliot_feed_data(self, datafeed: DataFeed[Any]) -> Optional[float]:
         """Fetch spot price data from API sources and calculate a value
@@ -105,24 +129,23 @@ class ConditionalReporter(Tellor360Reporter):
             logger.info(f"no datafeed was setß: {self.datafeed}. Please provide a spot-price query type (see --help)")
             return False
         tellor_latest_data = await self.get_tellor_latest_data()
-        telliot_feed_data = await self.get_telliot_feed_data(datafeed=self.datafeed)
-        time = current_time()
-        time_passed_since_tellor_report = time - tellor_latest_data.timestampRetrieved if tellor_latest_data else time
         if tellor_latest_data is None:
             logger.debug("tellor data returned None")
             return True
-        elif not tellor_latest_data.retrieved:
+        if not tellor_latest_data.retrieved:
             logger.debug(f"No oracle submissions in tellor for query: {self.datafeed.query.descriptor}")
             return True
-        elif time_passed_since_tellor_report > self.stale_timeout:
+        time_passed_since_tellor_report = current_time() - tellor_latest_data.timestampRetrieved
+        if time_passed_since_tellor_report > self.stale_timeout:
             logger.debug(f"tellor data is stale, time elapsed since last report: {time_passed_since_tellor_report}")
             return True
-        elif self.tellor_price_change_above_max(tellor_latest_data, telliot_feed_data):
+        # only fetch from API sources once the price change is the deciding condition
+        telliot_feed_data = await self.get_telliot_feed_data(datafeed=self.datafeed)
+        if self.tellor_price_change_above_max(tellor_latest_data, telliot_feed_data):
             logger.debug("tellor price change above max")
             return True
-        else:
-            logger.debug(f"tellor {self.datafeed.query.descriptor} data is recent enough")
-            return False
+        logger.debug(f"tellor {self.datafeed.query.descriptor} data is recent enough")
+        return False
 
     async def report(self, report_count: Optional[int] = None) -> None:
         """Submit values to Tellor oracles on an interval."""
@@ -132,7 +155,10 @@ class ConditionalReporter(Tellor360Reporter):
             if online:
                 if self.has_native_token():
                     if await self.conditions_met():
-                        _, _ = await self.report_once()
+                        _, status = await self.report_once()
+                        if status.ok:
+                            # our own report is now the latest oracle value
+                            self.flush_tellor_cache()
                     else:
                         logger.info("feeds are recent enough, no need to report")
 
@@ -2,21 +2,23 @@
 
 Example of a subclassed Reporter.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import List
 from typing import Optional
 from typing import Tuple
 
 from chained_accounts import ChainedAccount
-from eth_account.account import Account
 from eth_account.signers.local import LocalAccount
 from eth_utils import to_checksum_address
-from requests.exceptions import HTTPError
+from requests.exceptions import RequestException
 from telliot_core.utils.response import error_status
 from telliot_core.utils.response import ResponseStatus
 from web3.exceptions import TransactionNotFound
 from web3.types import TxReceipt
 
 from telliot_feeds.flashbots import flashbot  # type: ignore
+from telliot_feeds.flashbots.flashbots import FlashbotsTransactionResponse  # type: ignore
 from telliot_feeds.flashbots.provider import get_default_endpoint  # type: ignore
 from telliot_feeds.reporters.tellor_360 import Tellor360Reporter
 from telliot_feeds.utils.log import get_logger
@@ -31,8 +33,8 @@ class FlashbotsReporter(Tellor360Reporter):
 
     def __init__(self, signature_account: ChainedAccount, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self.account._local_account = Account.from_key(self.account.key)
-        self.signature_account: LocalAccount = Account.from_key(signature_account.key)
+        # unlocking a ChainedAccount already derives its LocalAccount, so reuse it
+        self.signature_account: LocalAccount = signature_account.local_account
         self.sig_acct_addr = to_checksum_address(signature_account.address)
 
         logger.info(f"Reporting with account: {self.acct_addr}")
@@ -50,33 +52,49 @@ class FlashbotsReporter(Tellor360Reporter):
             {"signed_transaction": tx_signed.rawTransaction},
         ]
 
-        # Send bundle to be executed in the next block
+        # Sign once, then send the bundle to be executed in each of the next five blocks.
+        # The relay posts are independent so they are sent concurrently.
+        flashbots = self.endpoint._web3.flashbots
+        signed_txs = flashbots.sign_bundle(bundle)
         block = self.endpoint._web3.eth.block_number
-        # results = []
-        # for target_block in [block + k for k in [1, 2, 3, 4, 5]]:
-        #     results.append(
-        #         self.endpoint._web3.flashbots.send_bundle(
-        #             bundle, target_block_number=target_block
-        #         )
-        #     )
-        # result = results[-1]
-        try:
-            result = self.endpoint._web3.flashbots.send_bundle(bundle, target_block_number=block + 1)
-        except HTTPError as e:
-            msg = "Unable to send bundle to miners due to HTTP error"
-            return None, error_status(note=msg, e=e, log=logger.error)
-
-        logger.info(f"Bundle sent to miners in block {block}")
-
-        # Wait for transaction confirmation
-        result.wait()
-        try:
-            tx_receipt = result.receipts()[0]
-            print(f"Bundle was executed in block {tx_receipt.blockNumber}")
-        except TransactionNotFound as e:
-            status.error = "Bundle was not executed: " + str(e)
+        target_blocks = [block + k for k in [1, 2, 3, 4, 5]]
+        with ThreadPoolExecutor(max_workers=len(target_blocks)) as executor:
+            posts = [(t, executor.submit(flashbots.send_raw_bundle, signed_txs, t)) for t in target_blocks]
+
+        # the bundle can still land if only some of the posts failed, so only give up if all of them did
+        sent_blocks: List[int] = []
+        send_error: Optional[Exception] = None
+        for target, post in posts:
+            try:
+                post.result()
+                sent_blocks.append(target)
+            # web3 raises ValueError for JSON-RPC error replies from the relay
+            except (RequestException, ValueError) as e:
+                send_error = e
+                logger.warning(f"Unable to send bundle to miners for block {target}: {e}")
+        if not sent_blocks:
+            msg = "Unable to send bundle to miners"
+            return None, error_status(note=msg, e=send_error, log=logger.error)
+
+        results = [FlashbotsTransactionResponse(self.endpoint._web3, signed_txs, target) for target in sent_blocks]
+
+        logger.info(f"Bundle sent to miners for blocks {sent_blocks}")
+
+        # Wait for transaction confirmation, checking each target block as it's reached
+        # and stopping at the first one that included the bundle
+        not_found: Optional[TransactionNotFound] = None
+        for result in results:
+            try:
+                tx_receipt = result.receipts()[0]
+                logger.info(f"Bundle was executed in block {tx_receipt.blockNumber}")
+                break
+            except TransactionNotFound as e:
+                not_found = e
+        else:
+            status.error = f"Bundle was not executed in blocks {sent_blocks}: {not_found}"
             logger.error(status.error)
-            status.e = e
+            status.ok = False
+            status.e = not_found
             return None, status
 
         tx_hash = tx_receipt["transactionHash"].hex()
@@ -37,12 +37,7 @@ class GasFees:
     returns gas_info for the transaction type
     """
 
-    gas_info: GasParams = {
-        "maxPriorityFeePerGas": None,
-        "maxFeePerGas": None,
-        "gasPrice": None,
-        "gas": None,
-    }
+    gas_info: GasParams
 
     @staticmethod
     def to_gwei(value: Union[Wei, int]) -> Union[int, float]:
@@ -119,15 +114,17 @@ class GasFees:
         self.acct_address = to_checksum_address(account.address)
         self.web3: Web3 = endpoint._web3
         assert self.web3 is not None, f"Web3 is not initialized, check endpoint {endpoint}"
+        # each instance owns its gas_info so fees set by one reporter never leak into another
+        self._reset_gas_info()
 
     def set_gas_info(self, fees: FEES) -> None:
-        """Set class variable gas_info keys to values in fees"""
+        """Set gas_info keys to values in fees"""
         for fee in fees:
             logger.debug(f"Setting gas info {fee} to {fees[fee]}")
             self.gas_info[fee] = fees[fee]
 
     def _reset_gas_info(self) -> None:
-        """Resets class variable gas_info keys to None values
+        """Resets gas_info keys to None values
         This is used to reset gas_info before updating gas_info
         """
         self.gas_info = {
@@ -232,10 +229,12 @@ class GasFees:
             return priority_fee, ResponseStatus()
         else:
             try:
-                # Fetch the base fee
-                _base_fee, status = self.get_base_fee()
+                # Fetch the base fee, reusing the caller's fee history instead of requesting it again
+                _base_fee: Optional[Union[Wei, FeeHistory]] = fee_history
                 if _base_fee is None:
-                    return None, error_status("no base fee set", e=status.error, log=logger.error)
+                    _base_fee, status = self.get_base_fee()
+                    if _base_fee is None:
+                        return None, error_status("no base fee set", e=status.error, log=logger.error)
 
                 if not isinstance(_base_fee, int):
                     base_fee = _base_fee["baseFeePerGas"][-1]  # Get the latest base fee from history
@@ -335,7 +334,7 @@ class GasFees:
         }, ResponseStatus()
 
     def update_gas_fees(self) -> ResponseStatus:
-        """Update class gas_info with the latest gas fees whenever called"""
+        """Update gas_info with the latest gas fees whenever called"""
         self._reset_gas_info()
         self.set_gas_info({"gas": self.gas_limit})
         if self.transaction_type == 0:
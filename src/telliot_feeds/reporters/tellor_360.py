@@ -37,6 +37,9 @@ from telliot_feeds.utils.stake_info import StakeInfo
 
 logger = get_logger(__name__)
 
+# Seconds to reuse token prices fetched for the profitability check
+TOKEN_PRICE_CACHE_TTL = 20
+
 
 class Tellor360Reporter(Stake):
     """Reports values from given datafeeds to a TellorFlex."""
@@ -70,6 +73,9 @@ class Tellor360Reporter(Stake):
         self.wait_period = wait_period
         self.chain_id = chain_id
         self.acct_addr = to_checksum_address(self.account.address)
+        self._token_prices: Optional[Tuple[float, float]] = None
+        self._token_prices_expiry = 0.0
+        self._contract_functions: Dict[str, Any] = {}
         logger.info(f"Reporting with account: {self.acct_addr}")
 
     async def get_stake_amount(self) -> Tuple[Optional[int], ResponseStatus]:
@@ -245,6 +251,32 @@ class Tellor360Reporter(Stake):
 
         return self.datafeed
 
+    async def fetch_token_prices(self) -> Tuple[Optional[float], Optional[float]]:
+        """Fetch native token and TRB prices in USD
+
+        Prices are reused for TOKEN_PRICE_CACHE_TTL seconds after a successful fetch
+        since they move far slower than the report loop runs.
+
+        Returns:
+        - (native token price, TRB price) either of which is None if its fetch failed
+        """
+        now = time.monotonic()
+        if self._token_prices is not None and now < self._token_prices_expiry:
+            return self._token_prices
+
+        native_token_feed = get_native_token_feed(self.chain_id)
+        price_feeds = [native_token_feed, trb_usd_median_feed]
+        _ = await asyncio.gather(*(feed.source.fetch_new_datapoint() for feed in price_feeds))
+        price_native_token = native_token_feed.source.latest[0]
+        price_trb_usd = trb_usd_median_feed.source.latest[0]
+
+        if price_native_token is None or price_trb_usd is None:
+            return price_native_token, price_trb_usd
+
+        self._token_prices = (price_native_token, price_trb_usd)
+        self._token_prices_expiry = now + TOKEN_PRICE_CACHE_TTL
+        return self._token_prices
+
     async def ensure_profitable(self) -> ResponseStatus:
 
         status = ResponseStatus()
@@ -253,11 +285,7 @@ class Tellor360Reporter(Stake):
 
         tip = self.to_ether(self.autopaytip)
         # Fetch token prices in USD
-        native_token_feed = get_native_token_feed(self.chain_id)
-        price_feeds = [native_token_feed, trb_usd_median_feed]
-        _ = await asyncio.gather(*[feed.source.fetch_new_datapoint() for feed in price_feeds])
-        price_native_token = native_token_feed.source.latest[0]
-        price_trb_usd = trb_usd_median_feed.source.latest[0]
+        price_native_token, price_trb_usd = await self.fetch_token_prices()
 
         if price_native_token is None or price_trb_usd is None:
             return error_status("Unable to fetch token price", log=logger.warning)
@@ -316,6 +344,8 @@ class Tellor360Reporter(Stake):
 
         Returns a tuple of the web3 function object and a ResponseStatus object
         """
+        query = datafeed.query
+        query_id = query.query_id
         # Update datafeed value
         await datafeed.source.fetch_new_datapoint()
         latest_data = datafeed.source.latest
@@ -323,11 +353,10 @@ class Tellor360Reporter(Stake):
             msg = "Unable to retrieve updated datafeed value."
             return None, error_status(msg, log=logger.info)
         # Get query info & encode value to bytes
-        query_id = datafeed.query.query_id
-        query_data = datafeed.query.query_data
+        query_data = query.query_data
         try:
-            value = datafeed.query.value_type.encode(latest_data[0])
-            logger.debug(f"Current query: {datafeed.query.descriptor}")
+            value = query.value_type.encode(latest_data[0])
+            logger.debug(f"Current query: {query.descriptor}")
             logger.debug(f"Reporter Encoded value: {value.hex()}")
         except Exception as e:
             msg = f"Error encoding response value {latest_data[0]}"
@@ -347,7 +376,10 @@ class Tellor360Reporter(Stake):
     ) -> Tuple[Optional[ContractFunction], ResponseStatus]:
         """Assemble a contract function"""
         try:
-            func = self.oracle.contract.get_function_by_name(function_name)(**transaction_params)
+            # the ABI lookup is deterministic, so resolve each function name once
+            if function_name not in self._contract_functions:
+                self._contract_functions[function_name] = self.oracle.contract.get_function_by_name(function_name)
+            func = self._contract_functions[function_name](**transaction_params)
             return func, ResponseStatus()
         except Exception as e:
             return None, error_status("Error assembling function", e, logger.error)
@@ -463,7 +495,8 @@ class Tellor360Reporter(Stake):
         if not status.ok or params is None:
             return None, status
 
-        build_tx, status = self.build_transaction("submitValue", **params)
+        # building and sending make blocking node calls so run them off the event loop
+        build_tx, status = await asyncio.to_thread(self.build_transaction, "submitValue", **params)
         if not status.ok or build_tx is None:
             return None, status
 
@@ -474,7 +507,7 @@ class Tellor360Reporter(Stake):
             return None, status
 
         logger.debug("Sending submitValue transaction")
-        tx_receipt, status = self.sign_n_send_transaction(build_tx)
+        tx_receipt, status = await asyncio.to_thread(self.sign_n_send_transaction, build_tx)
         # reset datafeed for a new suggestion if qtag wasn't selected in cli
         if self.qtag_selected is False:
             self.datafeed = None
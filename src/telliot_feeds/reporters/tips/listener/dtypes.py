@@ -4,6 +4,8 @@ from dataclasses import field
 
 @dataclass
 class Values:
+    __slots__ = ("value", "timestamp")
+
     value: bytes
     timestamp: int
 
@@ -1,4 +1,5 @@
 import math
+from dataclasses import fields
 from typing import Optional
 
 from eth_abi import encode_abi
@@ -100,7 +101,7 @@ class FundedFeedFilter:
                 logger.info(f"Unable to decode query data {query_data.hex()}")
                 return None
             datafeed.query = query
-            for param in datafeed.query.__dict__.keys():
+            for param in [f.name for f in fields(datafeed.query)]:
                 val = getattr(query, param)
                 setattr(datafeed.source, param, val)
 
@@ -142,22 +143,25 @@ class FundedFeedFilter:
         Returns: filtered feeds list
         """
         for feed in feeds:
+            timestamps_values = feed.queryid_timestamps_values_list
             # in case a query id has has none or too few to compare
-            if len(feed.queryid_timestamps_values_list) < 2:
+            if len(timestamps_values) < 2:
                 continue
-            for current, previous in zip(
-                feed.queryid_timestamps_values_list[::-1], feed.queryid_timestamps_values_list[-2::-1]
-            ):
+            params = feed.params
+            # collect positions to drop and rebuild the list once instead of list.remove per value
+            ineligible: set[int] = set()
+            for i in range(len(timestamps_values) - 1, 0, -1):
+                current, previous = timestamps_values[i], timestamps_values[i - 1]
                 in_eligibile_window = self.is_timestamp_first_in_window(
                     timestamp_before=previous.timestamp,
                     timestamp_to_check=current.timestamp,
-                    feed_start_timestamp=feed.params.startTime,
-                    feed_window=feed.params.window,
-                    feed_interval=feed.params.interval,
+                    feed_start_timestamp=params.startTime,
+                    feed_window=params.window,
+                    feed_interval=params.interval,
                 )
                 if not in_eligibile_window:
-                    if feed.params.priceThreshold == 0:
-                        feed.queryid_timestamps_values_list.remove(current)
+                    if params.priceThreshold == 0:
+                        ineligible.add(i)
                     else:
                         try:
                             previous_value = int(int(previous.value.hex(), 16) / 1e18)
@@ -167,8 +171,10 @@ class FundedFeedFilter:
 
                         price_change = _get_price_change(previous_val=previous_value, current_val=current.value)
 
-                        if price_change < feed.params.priceThreshold:
-                            feed.queryid_timestamps_values_list.remove(current)
+                        if price_change < params.priceThreshold:
+                            ineligible.add(i)
+            if ineligible:
+                timestamps_values[:] = [tv for i, tv in enumerate(timestamps_values) if i not in ineligible]
 
         return feeds
 
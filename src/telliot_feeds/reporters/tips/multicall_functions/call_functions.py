@@ -11,6 +11,7 @@ from telliot_feeds.reporters.tips.listener.assemble_call import AssembleCall
 class CallFunctions(AssembleCall):
     """
     Assemble Call for autopay functions:
+    - getCurrentTip
     - getDataBefore
     - getIndexForDataBefore - Now
     - getIndexForDataBefore - 1 MONTH ago
@@ -48,6 +49,25 @@ class CallFunctions(AssembleCall):
             param3=timestamps,
         )
 
+    def get_current_tip(self, query_id: bytes, handler_function: Optional[Callable[..., Any]] = None) -> Call:
+        """getCurrentTip autopay Call object for a query id
+
+        Args:
+        - query_id
+        - handler_function: function to interpret contract reponse (optional)
+
+        Return: Call object
+        example return from this call:
+        >>> {('current_tip', b'query_id'): 0}
+        """
+        return self.assemble_call_object(
+            func_sig="getCurrentTip(bytes32)(uint256)",
+            returns=[
+                [("current_tip", query_id), handler_function],
+            ],
+            query_id=query_id,
+        )
+
     def get_current_feeds(self, query_id: bytes, handler_function: Optional[Callable[..., Any]] = None) -> Call:
         """getCurrentFeeds autopay Call object for a query id
 
@@ -104,21 +104,23 @@ class MulticallAutopay(CallFunctions):
 
     async def currentfeeds_multiple_values_before(
         self, datafeed: DataFeed[Any], month_old_timestamp: int, now_timestamp: int
-    ) -> tuple[Optional[list[QueryIdandFeedDetails]], ResponseStatus]:
-        """Batch call two functions (getDataBefore,getIndexForDataBefore)
+    ) -> tuple[Optional[tuple[int, list[QueryIdandFeedDetails]]], ResponseStatus]:
+        """Batch call three functions (getCurrentTip,getCurrentFeeds,getMultipleValuesBefore)
 
         Args:
         - now_timestamp: current time in unix timestamps
         - month_old_timestamp: now_timestamp - 2_592_000
 
-        Return: a list of QueryIdandFeedDetails
+        Return: the one time tip amount and a list of QueryIdandFeedDetails
 
         fetches:
+        - one time tip for the query id
         - list of feed_ids
         - most recent value and timestamp and index
         - month old value index
         >>> example response from multicall looks like
         {
+            ('current_tip', b'query_id'): 0,
             b'query_id': [b'feed_id',],
             ('values_array, b'query_id'): (values in bytes),
             ('timestamps_array', b'query_id'): (timestamps)
@@ -126,6 +128,7 @@ class MulticallAutopay(CallFunctions):
         """
         query_id = datafeed.query.query_id
         calls = [
+            self.get_current_tip(query_id=query_id),
             self.get_current_feeds(query_id=query_id),
             self.get_multiple_values_before(
                 query_id=query_id, now_timestamp=now_timestamp, max_age=month_old_timestamp
@@ -141,34 +144,42 @@ class MulticallAutopay(CallFunctions):
             msg = "Empty response from multicall getCurrentFeeds..."
             return None, error_status(msg)
 
-        # create QueryIdFeedDetails type that holds attributes of all response data
-        feeds = []
-        for feed_id in resp[query_id]:
-            values = resp[("values_array", query_id)]
-            timestamps = resp[("timestamps_array", query_id)]
+        # None means the getCurrentTip call failed
+        one_time_tip = resp[("current_tip", query_id)] or 0
 
-            # short circuit the loop since None means failed response and can't calculate tip accurately
-            if values is None:
-                note = "getMultipleValuesBefore call failed"
-                return None, error_status(note)
+        feed_ids = resp[query_id]
+        if not feed_ids:
+            return (one_time_tip, []), status
+
+        values = resp[("values_array", query_id)]
+        timestamps = resp[("timestamps_array", query_id)]
+
+        # short circuit since None means failed response and can't calculate tip accurately
+        if values is None:
+            note = "getMultipleValuesBefore call failed"
+            return None, error_status(note)
 
-            current_value = values[-1] if values else b""
-            current_value_timestamp = timestamps[-1] if timestamps else 0
-            values_lis = values[:-1]
-            timestamps_lis = timestamps[:-1]
-            timestamps_values_list = list(map(Values, values_lis, timestamps_lis))
+        # values and timestamps belong to the query id so they're the same for every feed id
+        current_value = values[-1] if values else b""
+        current_value_timestamp = timestamps[-1] if timestamps else 0
+        timestamps_values_list = list(map(Values, values[:-1], timestamps[:-1]))
+        query_data = datafeed.query.query_data
 
-            feed = QueryIdandFeedDetails(
+        # create QueryIdFeedDetails type that holds attributes of all response data
+        # each feed gets its own copy of the timestamps values list since the filters remove from it in place
+        feeds = [
+            QueryIdandFeedDetails(
                 feed_id=feed_id,
                 query_id=query_id,
-                query_data=datafeed.query.query_data,
+                query_data=query_data,
                 current_queryid_value=current_value,
                 current_value_timestamp=current_value_timestamp,
-                queryid_timestamps_values_list=timestamps_values_list,
+                queryid_timestamps_values_list=list(timestamps_values_list),
             )
-            feeds.append(feed)
+            for feed_id in feed_ids
+        ]
 
-        return feeds, status
+        return (one_time_tip, feeds), status
 
     async def timestamp_datafeed(
         self, feeds: list[QueryIdandFeedDetails]
@@ -1,3 +1,4 @@
+from dataclasses import fields
 from typing import Any
 from typing import Optional
 from typing import Tuple
@@ -62,7 +63,7 @@ async def get_feed_and_tip(
         if datafeed is not None:
             query = get_query_from_qtyp_name(query_data)
             datafeed.query = query  # type: ignore
-            for param in datafeed.query.__dict__.keys():
+            for param in [f.name for f in fields(datafeed.query)]:
                 val = getattr(query, param)
                 setattr(datafeed.source, param, val)
             break
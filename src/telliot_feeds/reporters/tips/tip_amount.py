@@ -31,22 +31,26 @@ async def fetch_feed_tip(
     month_old = int(timestamp - 2_592_000)
     tip_amount: int = 0
 
-    # get tip amount for one time tip if available
-    one_time_tip, status = await autopay.get_current_tip(query_id=datafeed.query.query_id)
-
-    if status.ok:
-        tip_amount += one_time_tip
-
-    # make the first batch call of getCurrentFeeds, getDataBefore, getTimestampbyQueryIdandIndex
+    # make the first batch call of getCurrentTip, getCurrentFeeds, getMultipleValuesBefore
     results, status = await call.currentfeeds_multiple_values_before(
         datafeed=datafeed, now_timestamp=timestamp, month_old_timestamp=month_old
     )
 
-    if not status.ok or not results:
+    if not status.ok or results is None:
+        # get tip amount for one time tip if available
+        one_time_tip, status = await autopay.get_current_tip(query_id=datafeed.query.query_id)
+        if status.ok:
+            tip_amount += one_time_tip
+        return tip_amount
+
+    one_time_tip, feeds = results
+    tip_amount += one_time_tip
+
+    if not feeds:
         return tip_amount
 
     # get query id timestamps list and feed ids datafeed
-    timestamps_list_and_datafeed, status = await call.timestamp_datafeed(results)
+    timestamps_list_and_datafeed, status = await call.timestamp_datafeed(feeds)
 
     if not status.ok or not timestamps_list_and_datafeed:
         return tip_amount
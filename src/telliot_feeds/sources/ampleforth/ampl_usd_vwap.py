@@ -204,7 +204,7 @@ class AmpleforthCustomSpotPriceSource(DataSource[float]):
         """
 
         sources = self.sources
-        datapoints = await asyncio.gather(*[source.fetch_new_datapoint() for source in sources])
+        datapoints = await asyncio.gather(*(source.fetch_new_datapoint() for source in sources))
         return datapoints
 
     async def fetch_new_datapoint(self) -> OptionalDataPoint[float]:
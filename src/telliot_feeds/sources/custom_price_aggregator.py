@@ -63,7 +63,7 @@ class CustomPriceAggregator(DataSource[float]):
 
         async def gather_inputs() -> List[OptionalDataPoint[float]]:
             sources = self.sources
-            datapoints = await asyncio.gather(*[source.fetch_new_datapoint() for source in sources])
+            datapoints = await asyncio.gather(*(source.fetch_new_datapoint() for source in sources))
             return datapoints
 
         inputs = await gather_inputs()
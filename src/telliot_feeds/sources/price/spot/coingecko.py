@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
+from typing import Dict
 from urllib.parse import urlencode
 
-from requests import Session
 from requests.exceptions import ConnectionError
 from requests.exceptions import Timeout
 from requests.exceptions import TooManyRedirects
@@ -11,6 +11,7 @@ from telliot_core.apps.telliot_config import TelliotConfig
 
 from telliot_feeds.dtypes.datapoint import datetime_now_utc
 from telliot_feeds.dtypes.datapoint import OptionalDataPoint
+from telliot_feeds.pricing.price_service import get_session
 from telliot_feeds.pricing.price_service import WebPriceService
 from telliot_feeds.pricing.price_source import PriceSource
 from telliot_feeds.utils.log import get_logger
@@ -127,16 +128,15 @@ class CoinGeckoSpotPriceService(WebPriceService):
         url_params = urlencode({"ids": coin_id, "vs_currencies": currency})
         request_url = self.url + "/api/v3/simple/price?{}".format(url_params)
 
-        session = Session()
+        headers: Dict[str, str] = {}
         if API_KEY != "":
             headers = {
                 "Accepts": "application/json",
                 "x-cg-pro-api-key": API_KEY,
             }
-            session.headers.update(headers)
 
         try:
-            response = session.get(request_url)
+            response = get_session().get(request_url, headers=headers)
 
             if response.status_code >= 400:
                 logger.warning(f"CoinGecko Error Status {response.status_code}: {response}")
@@ -6,6 +6,7 @@ import requests
 
 from telliot_feeds.dtypes.datapoint import datetime_now_utc
 from telliot_feeds.dtypes.datapoint import OptionalDataPoint
+from telliot_feeds.pricing.price_service import get_session
 from telliot_feeds.pricing.price_service import WebPriceService
 from telliot_feeds.pricing.price_source import PriceSource
 from telliot_feeds.utils.log import get_logger
@@ -54,19 +55,18 @@ class MaverickV2PriceService(WebPriceService):
 
         request_url = self.url + "/subgraphs/name/maverickprotocol/maverick-mainnet-app"
 
-        with requests.Session() as s:
-            try:
-                r = s.post(request_url, headers=headers, json=json_data, timeout=self.timeout)
-                res = r.json()
-                data = {"response": res}
+        try:
+            r = get_session().post(request_url, headers=headers, json=json_data, timeout=self.timeout)
+            res = r.json()
+            data = {"response": res}
 
-            except requests.exceptions.ConnectTimeout:
-                logger.warning("Timeout Error, No prices retrieved from MaverickV2")
-                return None, None
+        except requests.exceptions.ConnectTimeout:
+            logger.warning("Timeout Error, No prices retrieved from MaverickV2")
+            return None, None
 
-            except Exception:
-                logger.warning("No prices retrieved from MaverickV2")
-                return None, None
+        except Exception:
+            logger.warning("No prices retrieved from MaverickV2")
+            return None, None
 
         if "error" in data:
             logger.error(data)
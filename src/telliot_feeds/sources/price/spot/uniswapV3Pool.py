@@ -1,13 +1,14 @@
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
+from typing import Dict
 
 import requests
-from requests import Session
 from telliot_core.apps.telliot_config import TelliotConfig
 
 from telliot_feeds.dtypes.datapoint import datetime_now_utc
 from telliot_feeds.dtypes.datapoint import OptionalDataPoint
+from telliot_feeds.pricing.price_service import get_session
 from telliot_feeds.pricing.price_service import WebPriceService
 from telliot_feeds.pricing.price_source import PriceSource
 from telliot_feeds.utils.log import get_logger
@@ -63,24 +64,22 @@ class UniswapV3PoolPriceService(WebPriceService):
 
         request_url = f"{self.url}/api/subgraphs/id/5zvR82QoaXYFyDEKLZ9t6v9adgnptxYpKpSbxtgVENFV"
 
-        session = Session()
+        headers: Dict[str, str] = {}
         if API_KEY != "":
             headers = {"Accepts": "application/json", "Authorization": f"Bearer {API_KEY}"}
-            session.headers.update(headers)
 
-        with requests.Session() as s:
-            try:
-                r = s.post(request_url, headers=headers, json=json_data, timeout=self.timeout)
-                res = r.json()
-                data = {"response": res}
+        try:
+            r = get_session().post(request_url, headers=headers, json=json_data, timeout=self.timeout)
+            res = r.json()
+            data = {"response": res}
 
-            except requests.exceptions.ConnectTimeout:
-                logger.warning("Timeout Error, No pool prices retrieved from Uniswap")
-                return None, None
+        except requests.exceptions.ConnectTimeout:
+            logger.warning("Timeout Error, No pool prices retrieved from Uniswap")
+            return None, None
 
-            except Exception:
-                logger.warning("No pool prices retrieved from Uniswap")
-                return None, None
+        except Exception:
+            logger.warning("No pool prices retrieved from Uniswap")
+            return None, None
 
         if "error" in data:
             logger.error(data)
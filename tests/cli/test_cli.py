@@ -12,6 +12,7 @@ from telliot_feeds.cli.constants import STAKE_MESSAGE
 from telliot_feeds.cli.main import main as cli_main
 from telliot_feeds.cli.utils import build_feed_from_input
 from telliot_feeds.cli.utils import parse_profit_input
+from telliot_feeds.feeds import DATAFEED_BUILDER_MAPPING
 
 
 def stop():
@@ -69,6 +70,21 @@ def test_build_evm_call_feed_from_input(capsys):
         assert feed.source.calldata == calldata
 
 
+def test_build_same_feed_twice():
+    """Test rebuilding a feed whose query id was cached by the previous build"""
+    num_choice = sorted(DATAFEED_BUILDER_MAPPING).index("EVMCall") + 1
+    contract_address = "0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0"
+
+    with mock.patch("builtins.input", side_effect=[num_choice, "1", contract_address, "0x18160ddd"]):
+        feed = build_feed_from_input()
+        query_id = feed.query.query_id
+
+    with mock.patch("builtins.input", side_effect=[num_choice, "137", contract_address, "0x18160ddd"]):
+        feed = build_feed_from_input()
+        assert feed.query.chainId == 137
+        assert feed.query.query_id != query_id
+
+
 def test_parse_profit_input():
     """Test reading in custom expected profit from user."""
     result = parse_profit_input({}, None, "YOLO")
@@ -76,3 +76,27 @@ def test_evm_call_get_query_from_data():
     q2 = EVMCall.get_query_from_data(q.query_data)
     assert q2.query_data == q.query_data
     assert isinstance(q2, EVMCall)
+
+
+def test_evm_call_query_data_cached():
+    """Test query data and id are cached until a parameter changes."""
+    q = EVMCall(
+        chainId=1,
+        contractAddress="0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0",
+        calldata=b"\x18\x16\x0d\xdd",
+    )
+    query_data = q.query_data
+    query_id = q.query_id
+    assert q.query_data is query_data
+    assert q.query_id is query_id
+    assert "_query_id" not in q.get_state()
+
+    q.chainId = 137
+    assert q.query_data != query_data
+    assert q.query_id != query_id
+    expected = EVMCall(
+        chainId=137,
+        contractAddress="0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0",
+        calldata=b"\x18\x16\x0d\xdd",
+    )
+    assert q.query_data == expected.query_data
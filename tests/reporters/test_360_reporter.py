@@ -446,6 +446,38 @@ async def test_ensure_profitable(tellor_flex_reporter):
     assert status.error == "Estimated profitability below threshold."
 
 
+@pytest.mark.asyncio
+async def test_fetch_token_prices_cached(tellor_flex_reporter):
+    """Test token prices are reused within the cache ttl."""
+    r = tellor_flex_reporter
+    fetch = AsyncMock()
+    with patch.object(matic_usd_median_feed.source, "fetch_new_datapoint", fetch), patch.object(
+        trb_usd_median_feed.source, "fetch_new_datapoint", fetch
+    ):
+        matic_usd_median_feed.source.store_datapoint((1.0, datetime.datetime.now()))
+        trb_usd_median_feed.source.store_datapoint((10.0, datetime.datetime.now()))
+
+        assert await r.fetch_token_prices() == (1.0, 10.0)
+        assert await r.fetch_token_prices() == (1.0, 10.0)
+        assert fetch.await_count == 2
+
+        r._token_prices_expiry = 0.0
+        await r.fetch_token_prices()
+        assert fetch.await_count == 4
+
+
+def test_assemble_function_cached(tellor_flex_reporter):
+    """Test contract functions are looked up in the ABI once per name."""
+    r = tellor_flex_reporter
+    lookup = mock.Mock(wraps=r.oracle.contract.get_function_by_name)
+    with patch.object(r.oracle.contract, "get_function_by_name", lookup):
+        for _ in range(2):
+            func, status = r.assemble_function("getStakeAmount")
+            assert status.ok
+            assert func is not None
+    assert lookup.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_ethgasstation_error(tellor_flex_reporter):
     with mock.patch("telliot_feeds.reporters.tellor_360.Tellor360Reporter.update_gas_fees") as func:
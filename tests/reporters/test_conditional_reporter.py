@@ -1,11 +1,14 @@
 from contextlib import ExitStack
+from unittest.mock import AsyncMock
 from unittest.mock import patch
 
 import pytest
+from telliot_core.utils.response import ResponseStatus
 
 from telliot_feeds.feeds import eth_usd_median_feed
 from telliot_feeds.reporters.customized.conditional_reporter import ConditionalReporter
 from telliot_feeds.reporters.customized.conditional_reporter import GetDataBefore
+from telliot_feeds.reporters.customized.conditional_reporter import TELLOR_CACHE_TTL
 from tests.utils.utils import chain_time
 
 
@@ -90,3 +93,57 @@ async def test_tellor_price_change_above_max(reporter, chain, caplog):
         await r.report(report_count=1)
         assert "tellor price change above max" in caplog.text
         assert "Sending submitValue transaction" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_tellor_data_cached(reporter):
+    """Test getDataBefore responses are reused until the cache expires or is flushed"""
+    r = await reporter
+    read = AsyncMock(return_value=((True, b"", 1), ResponseStatus()))
+
+    with patch.object(r.oracle, "read", read):
+        assert await r.get_tellor_latest_data() == GetDataBefore(True, b"", 1)
+        assert await r.get_tellor_latest_data() == GetDataBefore(True, b"", 1)
+        assert read.await_count == 1
+
+        r.flush_tellor_cache()
+        await r.get_tellor_latest_data()
+        assert read.await_count == 2
+
+        r.tellor_cache_ttl = 0
+        await r.get_tellor_latest_data()
+        assert read.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_tellor_cache_ttl_independent_of_stale_timeout(tellor_360, guaranteed_price_source):
+    """Test a large stale_timeout does not keep oracle data cached for long"""
+    contracts, account = tellor_360
+    r = ConditionalReporter(
+        oracle=contracts.oracle,
+        token=contracts.token,
+        autopay=contracts.autopay,
+        endpoint=contracts.oracle.node,
+        account=account,
+        chain_id=80001,
+        transaction_type=0,
+        min_native_token_balance=0,
+        datafeed=eth_usd_median_feed,
+        check_rewards=False,
+        stale_timeout=85500,
+        max_price_change=0.5,
+        wait_period=0,
+    )
+    assert r.tellor_cache_ttl == TELLOR_CACHE_TTL
+    read = AsyncMock(return_value=((True, b"", 1), ResponseStatus()))
+
+    with patch.object(r.oracle, "read", read), patch(f"{module}time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        await r.get_tellor_latest_data()
+        mock_time.monotonic.return_value = 1000.0 + TELLOR_CACHE_TTL - 1
+        await r.get_tellor_latest_data()
+        assert read.await_count == 1
+
+        mock_time.monotonic.return_value = 1000.0 + TELLOR_CACHE_TTL
+        await r.get_tellor_latest_data()
+        assert read.await_count == 2
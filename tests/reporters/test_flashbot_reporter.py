@@ -1,11 +1,17 @@
+from contextlib import ExitStack
 from unittest import mock
 
 import pytest
 import requests
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
 
 from telliot_feeds.feeds.matic_usd_feed import matic_usd_median_feed
 from telliot_feeds.reporters.flashbot import FlashbotsReporter
 
+module = "telliot_feeds.reporters.flashbot."
+
 
 @pytest.mark.asyncio
 async def test_http_error(tellor_360):
@@ -31,3 +37,116 @@ async def test_http_error(tellor_360):
         res, status = await r.report_once()
         assert res is None
         assert not status.ok
+
+
+@pytest.fixture(scope="function")
+def flashbots_reporter(tellor_360):
+    contracts, account = tellor_360
+    account.unlock("")
+
+    return FlashbotsReporter(
+        oracle=contracts.oracle,
+        token=contracts.token,
+        autopay=contracts.autopay,
+        endpoint=contracts.oracle.node,
+        account=account,
+        signature_account=account,
+        chain_id=5,
+        transaction_type=0,
+        min_native_token_balance=0,
+        datafeed=matic_usd_median_feed,
+        check_rewards=False,
+    )
+
+
+def patch_bundle_signing(r):
+    """Skip signing so sign_n_send_transaction can be called with a dummy transaction"""
+    stack = ExitStack()
+    stack.enter_context(
+        mock.patch.object(r.account.local_account, "sign_transaction", return_value=mock.Mock(rawTransaction=b""))
+    )
+    stack.enter_context(mock.patch.object(r.endpoint._web3.flashbots, "sign_bundle", return_value=[b""]))
+    return stack
+
+
+def test_partial_http_error(flashbots_reporter):
+    """Test the bundle is still awaited in the blocks that accepted it when some relay posts fail"""
+    r = flashbots_reporter
+    block = r.endpoint._web3.eth.block_number
+
+    def send_raw_bundle(signed_txs, target):
+        if target in (block + 1, block + 2):
+            raise requests.exceptions.HTTPError("relay error")
+
+    receipt = AttributeDict({"transactionHash": HexBytes("0x01"), "blockNumber": block + 3})
+    with patch_bundle_signing(r), mock.patch.object(
+        r.endpoint._web3.flashbots, "send_raw_bundle", side_effect=send_raw_bundle
+    ), mock.patch(f"{module}FlashbotsTransactionResponse") as response:
+        response.return_value.receipts.return_value = [receipt]
+        tx_receipt, status = r.sign_n_send_transaction({})
+
+    assert status.ok
+    assert tx_receipt == receipt
+    assert [c.args[2] for c in response.call_args_list] == [block + 3, block + 4, block + 5]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [requests.exceptions.ConnectionError("relay down"), requests.exceptions.Timeout("slow relay"), ValueError("rpc")],
+)
+def test_partial_non_http_error(flashbots_reporter, error):
+    """Test connection failures and JSON-RPC errors on one relay post don't abort the other blocks"""
+    r = flashbots_reporter
+    block = r.endpoint._web3.eth.block_number
+
+    def send_raw_bundle(signed_txs, target):
+        if target == block + 1:
+            raise error
+
+    receipt = AttributeDict({"transactionHash": HexBytes("0x01"), "blockNumber": block + 2})
+    with patch_bundle_signing(r), mock.patch.object(
+        r.endpoint._web3.flashbots, "send_raw_bundle", side_effect=send_raw_bundle
+    ), mock.patch(f"{module}FlashbotsTransactionResponse") as response:
+        response.return_value.receipts.return_value = [receipt]
+        tx_receipt, status = r.sign_n_send_transaction({})
+
+    assert status.ok
+    assert tx_receipt == receipt
+    assert [c.args[2] for c in response.call_args_list] == [block + 2, block + 3, block + 4, block + 5]
+
+
+def test_wait_stops_at_first_landed_block(flashbots_reporter):
+    """Test receipts are checked per target block until the bundle is found"""
+    r = flashbots_reporter
+    block = r.endpoint._web3.eth.block_number
+    receipt = AttributeDict({"transactionHash": HexBytes("0x01"), "blockNumber": block + 3})
+    responses = [mock.Mock() for _ in range(5)]
+    for resp in responses[:2]:
+        resp.receipts.side_effect = TransactionNotFound("not found")
+    for resp in responses[2:]:
+        resp.receipts.return_value = [receipt]
+
+    with patch_bundle_signing(r), mock.patch.object(r.endpoint._web3.flashbots, "send_raw_bundle"), mock.patch(
+        f"{module}FlashbotsTransactionResponse", side_effect=responses
+    ):
+        tx_receipt, status = r.sign_n_send_transaction({})
+
+    assert status.ok
+    assert tx_receipt == receipt
+    assert [resp.receipts.call_count for resp in responses] == [1, 1, 1, 0, 0]
+
+
+def test_bundle_not_executed(flashbots_reporter):
+    """Test the error status when the bundle lands in none of the target blocks"""
+    r = flashbots_reporter
+    with patch_bundle_signing(r), mock.patch.object(r.endpoint._web3.flashbots, "send_raw_bundle"), mock.patch(
+        f"{module}FlashbotsTransactionResponse"
+    ) as response:
+        response.return_value.receipts.side_effect = TransactionNotFound("not found")
+        tx_receipt, status = r.sign_n_send_transaction({})
+
+    assert tx_receipt is None
+    assert not status.ok
+    assert isinstance(status.e, TransactionNotFound)
+    assert "Bundle was not executed in blocks" in status.error
+    assert response.return_value.receipts.call_count == 5
@@ -108,6 +108,33 @@ async def test_get_eip1559_gas_price(gas_fees_object):
     assert eip1559_gas_price["maxFeePerGas"] == gas.get_max_fee(gas.from_gwei(150))
 
 
+@pytest.mark.asyncio
+async def test_eip1559_gas_price_fetches_fee_history_once(gas_fees_object):
+    gas: GasFees = await gas_fees_object
+    mock_fee_history = AttributeDict(
+        {
+            "baseFeePerGas": [13676801331, 14273862890],
+            "reward": [[100000000, 100000000, 1500000000]],
+        }
+    )
+    fee_history = Mock(return_value=mock_fee_history)
+    type(gas.web3.eth).fee_history = fee_history
+    eip1559_gas_price, status = gas.get_eip1559_gas_price()
+    assert status.ok
+    assert eip1559_gas_price is not None
+    assert fee_history.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_gas_info_not_shared(gas_fees_object):
+    gas: GasFees = await gas_fees_object
+    other = GasFees(endpoint=gas.endpoint, account=gas.account, transaction_type=0)
+
+    gas.set_gas_info({"gas": 21000})
+    assert gas.gas_info["gas"] == 21000
+    assert other.gas_info["gas"] is None
+
+
 @pytest.mark.asyncio
 async def test_update_gas_fees(gas_fees_object):
     gas: GasFees = await gas_fees_object
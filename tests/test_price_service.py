@@ -3,6 +3,7 @@ from unittest import mock
 import pytest
 import requests
 
+from telliot_feeds.pricing.price_service import get_session
 from telliot_feeds.pricing.price_service import WebPriceService
 
 
@@ -26,3 +27,9 @@ async def test_webpriceservice_errors(caplog):
 
         assert "error" in result
         assert "JSON Decode Error" == result["error"]
+
+
+def test_get_session_shared():
+    """Web price services reuse one HTTP session"""
+    assert isinstance(get_session(), requests.Session)
+    assert get_session() is get_session()
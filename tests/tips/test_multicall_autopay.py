@@ -64,3 +64,13 @@ async def test_get_current_feeds(setattr_autopay):
     assert assemble_call.function == "getCurrentFeeds(bytes32)(bytes32[])"
     assert assemble_call.target == call.autopay.address
     assert assemble_call.returns == [[b"", None]]
+
+
+@pytest.mark.asyncio
+async def test_get_current_tip(setattr_autopay):
+    call: MulticallAutopay = await setattr_autopay
+    assemble_call = call.get_current_tip(query_id=b"")
+    assert isinstance(assemble_call, Call)
+    assert assemble_call.function == "getCurrentTip(bytes32)(uint256)"
+    assert assemble_call.target == call.autopay.address
+    assert assemble_call.returns == [[("current_tip", b""), None]]
@@ -1,10 +1,17 @@
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
 import pytest
 from brownie import chain
 from eth_utils import to_bytes
 from telliot_core.apps.core import TelliotCore
+from telliot_core.utils.response import error_status
+from telliot_core.utils.response import ResponseStatus
 
 from telliot_feeds.feeds.matic_usd_feed import matic_usd_median_feed
 from telliot_feeds.reporters.tellor_360 import Tellor360Reporter
+from telliot_feeds.reporters.tips import tip_amount as tip_amount_module
 from telliot_feeds.reporters.tips.tip_amount import fetch_feed_tip
 
 
@@ -296,3 +303,29 @@ async def test_skip_manual_feed(autopay_contract_setup, mumbai_test_cfg, caplog)
     )
     _, status = await reporter.report_once()
     assert status.ok
+
+
+@pytest.mark.asyncio
+async def test_one_time_tip_from_multicall():
+    """Test the one time tip batched with getCurrentFeeds is used without a separate read"""
+    autopay = Mock(get_current_tip=AsyncMock())
+    batch = AsyncMock(return_value=((5, []), ResponseStatus()))
+    with patch.object(tip_amount_module.call, "currentfeeds_multiple_values_before", batch):
+        tip_amount = await fetch_feed_tip(autopay=autopay, datafeed=matic_usd_median_feed, timestamp=1234)
+    assert tip_amount == 5
+    autopay.get_current_tip.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_one_time_tip_fallback_when_multicall_fails():
+    """Test the one time tip is read directly from autopay when the multicall fails"""
+    autopay = Mock(get_current_tip=AsyncMock(return_value=(7, ResponseStatus())))
+    batch = AsyncMock(return_value=(None, error_status("multicall failed")))
+    with patch.object(tip_amount_module.call, "currentfeeds_multiple_values_before", batch):
+        tip_amount = await fetch_feed_tip(autopay=autopay, datafeed=matic_usd_median_feed, timestamp=1234)
+        assert tip_amount == 7
+        autopay.get_current_tip.assert_awaited_once_with(query_id=matic_usd_median_feed.query.query_id)
+
+        autopay.get_current_tip.return_value = (None, error_status("read failed"))
+        tip_amount = await fetch_feed_tip(autopay=autopay, datafeed=matic_usd_median_feed, timestamp=1234)
+        assert tip_amount == 0